@@ -134,24 +134,6 @@ def run_tests():
         os.chdir(Path(__file__).parent)
         return False
 
-def run_manual_tests():
-    """Run tests manually if pytest fails."""
-    print("\n🔄 Attempting manual test execution...")
-    
-    try:
-        # Import and run manual tests
-        sys.path.append(str(Path(__file__).parent))
-        from tests.test_phase1_ocr import run_phase1_tests
-        
-        print("🧪 Running manual test suite...")
-        passed, failed = run_phase1_tests()
-        
-        return failed == 0
-        
-    except Exception as e:
-        print(f"❌ Manual test execution failed: {e}")
-        return False
-
 def main():
     """Main test runner function."""
     print("🎯 AI Study Helper - Phase 1 Test Runner")
@@ -178,11 +160,7 @@ def main():
     print("=" * 60)
     
     tests_passed = run_tests()
-    
-    if not tests_passed:
-        print("\n⚠️  Pytest execution failed, trying manual tests...")
-        tests_passed = run_manual_tests()
-    
+
     # Final results
     print("\n" + "=" * 60)
     print("📊 FINAL TEST RESULTS")
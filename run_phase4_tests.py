@@ -76,30 +76,6 @@ def run_playwright_tests():
         print(f"❌ Error running tests: {e}")
         return False
 
-def run_manual_tests():
-    """Run manual tests for Phase 4 functionality"""
-    print("\n🔧 Running Manual Phase 4 Tests")
-    print("=" * 60)
-    
-    try:
-        # Import the test module
-        sys.path.append("tests")
-        from test_phase4_ai_tutor import run_phase4_tests
-        
-        # Run the manual tests
-        passed, failed = run_phase4_tests()
-        
-        if failed == 0:
-            print("✅ All manual Phase 4 tests passed!")
-            return True
-        else:
-            print(f"⚠️  {failed} manual Phase 4 tests failed!")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Error running manual tests: {e}")
-        return False
-
 def check_server_status():
     """Check if the Flask server is running"""
     print("\n🌐 Checking server status...")
@@ -146,12 +122,9 @@ def main():
     print("🧪 TESTING PHASE 4: AI TUTOR & MIND MAPS")
     print("=" * 60)
     
-    # Run Playwright tests
+    # Run Playwright tests; pytest is the single runner for this suite
     playwright_success = run_playwright_tests()
     
-    # Run manual tests
-    manual_success = run_manual_tests()
-    
     # Summary
     print("\n" + "=" * 60)
     print("📊 PHASE 4 TEST SUMMARY")
@@ -162,12 +135,7 @@ def main():
     else:
         print("❌ Playwright Tests: FAILED")
     
-    if manual_success:
-        print("✅ Manual Tests: PASSED")
-    else:
-        print("❌ Manual Tests: FAILED")
-    
-    overall_success = playwright_success and manual_success
+    overall_success = playwright_success
     
     if overall_success:
         print("\n🎉 PHASE 4 IMPLEMENTATION COMPLETE!")
@@ -0,0 +1,57 @@
+"""
+Shared helpers for the Phase 6 comprehensive suites.
+
+Both phase 6 entry points drive the same Flask app through
+playwright.async_api; anything they would otherwise duplicate lives
+here.
+"""
+
+BASE_URL = "http://localhost:5000"
+
+# (url, marker text, label) for every feature check the suites share,
+# compiled once so the two entry points cannot drift apart: the markup
+# probes in test_phase6_comprehensive GET each url and look for the
+# marker in the body, and ComprehensiveTestSuite waits for the same
+# marker as its page-loaded assertion.
+ROUTES = [
+    ("/ocr", "OCR Image Processing", "OCR page"),
+    ("/ai_generate", "AI Content Generation", "AI generation page"),
+    ("/quiz", "Quiz Generator", "Quiz page"),
+    ("/ai_tutor", "AI Tutor", "AI Tutor page"),
+    ("/mind_map", "Mind Map Generator", "Mind Map page"),
+    ("/", "Gamification Dashboard", "Gamification dashboard"),
+    ("/", "Offline Support", "Offline support section"),
+    ("/", "Multilingual Support", "Multilingual support section"),
+]
+
+# Markers for the dedicated feature pages (the home-dashboard entries
+# are handled separately, one visit for all of them)
+PAGE_MARKERS = {url: marker for url, marker, _ in ROUTES if url != "/"}
+
+# In-process cache of static asset bodies keyed by URL — the async twin
+# of the sync-API cache in conftest.py. The suites revisit the same
+# Bootstrap/JS/CSS bundles on every route; after the first fetch a
+# repeat request is served from memory and never touches Flask.
+STATIC_ASSET_GLOB = "**/*.{js,css,png,svg,woff2,ico}"
+_asset_cache = {}
+
+def _cacheable(headers):
+    """Honor an explicit no-store/no-cache from the server."""
+    cache_control = headers.get("cache-control", "")
+    return "no-store" not in cache_control and "no-cache" not in cache_control
+
+async def _cached_fulfill(route):
+    """Serve a static asset from memory, fetching once on a cold miss."""
+    url = route.request.url
+    if url in _asset_cache:
+        body, headers = _asset_cache[url]
+        await route.fulfill(status=200, body=body, headers=headers)
+        return
+    response = await route.fetch()
+    if response.ok and _cacheable(response.headers):
+        _asset_cache[url] = (await response.body(), response.headers)
+    await route.fulfill(response=response)
+
+async def enable_asset_cache(context):
+    """Route a context's static asset fetches through the in-memory cache."""
+    await context.route(STATIC_ASSET_GLOB, _cached_fulfill)
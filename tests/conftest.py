@@ -0,0 +1,463 @@
+"""
+Shared Playwright fixtures for the AI Study Helper test suites.
+
+One Chromium instance serves the whole pytest session (one per xdist
+worker); each test gets a fresh, cheap BrowserContext for isolation so
+no suite pays a browser cold-start per class or per test.
+
+Under pytest-xdist (pytest tests/ -n auto --dist=loadfile) every worker
+process gets its own copy of the session fixtures below, so browsers are
+naturally per-worker. The Flask app is started once, outside pytest
+(python app_v2.py etc.), and shared by all workers — no per-worker port
+juggling is needed.
+"""
+
+import os
+import queue
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+BASE_URL = "http://localhost:5000"
+
+# Headless by default; set HEADED=1 to watch the browser while debugging.
+HEADLESS = os.environ.get("HEADED") != "1"
+
+# The tests never render to a GPU, play audio, or use extensions — skip
+# launching those Chromium subprocesses to cut startup time and memory.
+LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-audio-output",
+    "--mute-audio",
+    "--disable-background-networking",
+]
+
+@pytest.fixture(scope="session")
+def playwright_instance():
+    """Start the Playwright driver process once per test process."""
+    driver = sync_playwright().start()
+    yield driver
+    driver.stop()
+
+@pytest.fixture(scope="session")
+def browser(playwright_instance):
+    """Launch a single shared Chromium instance for the whole session."""
+    browser = playwright_instance.chromium.launch(
+        headless=HEADLESS, args=LAUNCH_ARGS, chromium_sandbox=False
+    )
+    yield browser
+    browser.close()
+
+# In-process cache of static asset bodies keyed by URL; after the first
+# fetch, repeat requests never touch Flask. Opt in with TEST_ASSET_CACHE=1.
+CACHEABLE_RESOURCE_TYPES = {"stylesheet", "script", "font", "image"}
+_asset_cache = {}
+_asset_cache_headers = {}
+
+def _cached_fulfill(route):
+    """Serve static assets from memory, fetching once on a cold miss."""
+    request = route.request
+    if request.resource_type not in CACHEABLE_RESOURCE_TYPES:
+        route.continue_()
+        return
+    url = request.url
+    if url in _asset_cache:
+        route.fulfill(status=200, body=_asset_cache[url], headers=_asset_cache_headers[url])
+        return
+    response = route.fetch()
+    _asset_cache[url] = response.body()
+    _asset_cache_headers[url] = response.headers
+    route.fulfill(response=response)
+
+def enable_asset_cache(context):
+    """Route a context through the asset cache when TEST_ASSET_CACHE=1."""
+    if os.environ.get("TEST_ASSET_CACHE") == "1":
+        context.route("**/*", _cached_fulfill)
+
+def _port_open(port, host="127.0.0.1"):
+    with socket.socket() as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex((host, port)) == 0
+
+def _wait_for_port(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if _port_open(port):
+            return True
+        time.sleep(0.2)
+    return False
+
+def _warm_up_server():
+    """Pay Flask's lazy first-request init before any test does.
+
+    Template compilation, DB setup and model/tokenizer loads all happen
+    on first touch; hitting the hot routes here keeps that multi-second
+    stall out of whichever test happens to run first.
+    """
+    import requests
+
+    for path in ("/", "/api/health", "/api/gamification/progress"):
+        try:
+            requests.get(f"{BASE_URL}{path}", timeout=15)
+        except requests.RequestException:
+            # A route missing from older app versions is fine; the warm-up
+            # is best-effort
+            pass
+
+# App version each suite was written against. No single app serves every
+# phase: app_v6 has no /api/health or OCR/quiz APIs and most of its
+# feature pages reference templates that don't ship, while the earlier
+# apps lack the phase 6 dashboard. Keyed by test-module stem.
+SUITE_APPS = {
+    "test_phase1_ocr": "app_v2.py",
+    "test_phase2_ai": "app_v3.py",
+    "test_phase3_quiz_flashcard": "app_v4.py",
+    "test_phase4_ai_tutor": "app_v5.py",
+    "test_phase5_gamification_pwa_multilingual": "app_v5.py",
+    "test_phase6_comprehensive": "app_v6.py",
+    "test_phase6_comprehensive_testing": "app_v6.py",
+}
+
+def _suite_app(items):
+    """Pick the app matching the collected suite, or None if ambiguous."""
+    stems = {os.path.splitext(os.path.basename(str(item.fspath)))[0] for item in items}
+    apps = {SUITE_APPS[stem] for stem in stems if stem in SUITE_APPS}
+    return apps.pop() if len(apps) == 1 else None
+
+@pytest.fixture(scope="session", autouse=True)
+def flask_server(request):
+    """Ensure a Flask app is listening on :5000 for the whole session.
+
+    Reuses an externally started server when one is already up — the
+    normal dev flow, and how parallel xdist workers share one backend.
+    Otherwise starts the app named by TEST_APP, defaulting to the
+    version the collected suite was written against (SUITE_APPS above),
+    and tears it down at session end. Runs spanning suites with
+    different backends must bring their own server, since no one app
+    can satisfy them all.
+
+    Skipped entirely when every collected test is marked no_server
+    (the in-process Flask test-client suite).
+    """
+    if all(item.get_closest_marker("no_server") for item in request.session.items):
+        yield None
+        return
+    if _port_open(5000):
+        yield None
+        return
+    app_script = os.environ.get("TEST_APP") or _suite_app(request.session.items)
+    if app_script is None:
+        pytest.exit(
+            "Collected suites target different app versions and no server is "
+            "running on :5000 — start the right app yourself or set TEST_APP",
+            returncode=1,
+        )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(root, app_script)],
+        cwd=root,
+        env={**os.environ, "FLASK_ENV": "testing"},
+    )
+    if not _wait_for_port(5000, timeout=30):
+        proc.terminate()
+        pytest.exit(f"{app_script} did not start listening on :5000", returncode=1)
+    _warm_up_server()
+    yield proc
+    proc.terminate()
+    proc.wait(timeout=10)
+
+@pytest.fixture(scope="session")
+def base_url(flask_server):
+    """Base URL of the app under test, guaranteed to be serving."""
+    return BASE_URL
+
+@pytest.fixture(scope="session")
+def ai_ready():
+    """Wait once per session for the AI backend to report ready.
+
+    Hits /api/health directly instead of polling #modelStatus through
+    the DOM; tests that need the models loaded just depend on this
+    fixture and skip their own waits.
+    """
+    import requests
+
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            r = requests.get(f"{BASE_URL}/api/health", timeout=2)
+            if r.ok and r.json().get("components", {}).get("ai_generator"):
+                return r.json()
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    pytest.fail("AI backend did not become ready within 60 s")
+
+def count(page, selector):
+    """Count matching elements in one CDP call, without expect() polling.
+
+    Only for counts that are static once the page has loaded; anything
+    rendered asynchronously still needs expect(...).to_have_count().
+    """
+    return page.eval_on_selector_all(selector, "els => els.length")
+
+def check_selectors(page, selectors):
+    """Probe many selectors in one evaluate() round-trip.
+
+    Returns {selector: present?} for every CSS selector — one CDP call
+    instead of one expect() per selector.
+    """
+    return page.evaluate(
+        "(sels) => Object.fromEntries(sels.map(s => [s, !!document.querySelector(s)]))",
+        selectors,
+    )
+
+def batch_probe(page, specs):
+    """Resolve visibility (and optionally checked state) for many elements at once.
+
+    ``specs`` is a list of ``(selector, wants_checked)`` pairs; returns a
+    list of dicts in the same order — one evaluate() round-trip instead
+    of an expect() per element.
+    """
+    return page.evaluate(
+        """(specs) => specs.map(([sel, wantsChecked]) => {
+            const el = document.querySelector(sel);
+            if (!el) return { visible: false };
+            const r = el.getBoundingClientRect();
+            return {
+                visible: r.width > 0 && r.height > 0,
+                checked: wantsChecked ? el.checked : undefined,
+            };
+        })""",
+        [list(spec) for spec in specs],
+    )
+
+# Optional persistent profile: set PW_PROFILE_DIR (e.g. .pytest_pw_cache)
+# to keep Chromium's V8 code cache and HTTP cache across pytest runs.
+# Ephemeral contexts throw both away, so the homepage JS bundle is
+# re-parsed cold on every invocation.
+PROFILE_DIR = os.environ.get("PW_PROFILE_DIR")
+
+class LazyContext:
+    """Defer context creation until a page is actually requested.
+
+    The autouse _reset_state fixture drags shared_context into every
+    test; on filtered runs (e.g. pytest -k homepage) where no selected
+    test opens a page on it, the real context is never created.
+    """
+
+    def __init__(self, browser):
+        self._browser = browser
+        self._context = None
+
+    def _ensure(self):
+        if self._context is None:
+            if PROFILE_DIR:
+                self._context = self._browser.browser_type.launch_persistent_context(
+                    PROFILE_DIR,
+                    headless=HEADLESS,
+                    args=LAUNCH_ARGS,
+                    chromium_sandbox=False,
+                )
+            else:
+                self._context = self._browser.new_context()
+            enable_asset_cache(self._context)
+        return self._context
+
+    def new_page(self):
+        return self._ensure().new_page()
+
+    def clear_cookies(self):
+        if self._context is not None:
+            self._context.clear_cookies()
+
+    @property
+    def pages(self):
+        return self._context.pages if self._context is not None else []
+
+    def close(self):
+        if self._context is not None:
+            self._context.close()
+            self._context = None
+
+# LazyContexts actually created this session. _reset_state walks this
+# list instead of naming shared_context as a dependency — an autouse
+# dependency would eagerly launch the sync browser for every test,
+# including the async suites that bring their own.
+_live_shared_contexts = []
+
+@pytest.fixture(scope="session")
+def shared_context(browser):
+    """One long-lived BrowserContext shared by all per-test pages.
+
+    These suites are mostly read-only, so a single context plus an
+    explicit state wipe between tests (_reset_state below) is cheaper
+    than building a fresh context per test. Creation is lazy — see
+    LazyContext.
+    """
+    context = LazyContext(browser)
+    _live_shared_contexts.append(context)
+    yield context
+    _live_shared_contexts.remove(context)
+    context.close()
+
+@pytest.fixture
+def page(shared_context):
+    """Open a page on the shared context for the test, closed at teardown."""
+    page = shared_context.new_page()
+    yield page
+    page.close()
+
+@pytest.fixture(autouse=True)
+def _ui_only_blocking(request):
+    """Abort image/font/media requests for tests marked ui_only.
+
+    Only wired onto the per-test ``page`` fixture — routes registered on
+    the shared loaded_page or pooled contexts would leak into later
+    tests.
+    """
+    marked = request.node.get_closest_marker("ui_only") is not None
+    if marked and "page" in request.fixturenames:
+        page = request.getfixturevalue("page")
+        page.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in {"image", "font", "media"}
+            else route.continue_(),
+        )
+    yield
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    """Wipe cookies and web storage so tests can't leak through the shared context."""
+    yield
+    for context in _live_shared_contexts:
+        context.clear_cookies()
+        for pg in context.pages:
+            try:
+                pg.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+            except Exception:
+                # about:blank and already-closing pages have no storage to clear
+                pass
+
+# Pool sizing for the backend-heavy generation tests; contexts are
+# recycled after POOL_MAX_USES checkouts to keep memory flat on long
+# runs. BROWSER_POOL tunes the pool depth per worker — the browser
+# itself is already one-per-xdist-worker, so pooling contexts (not whole
+# browsers) is what amortizes here.
+POOL_SIZE = int(os.environ.get("BROWSER_POOL", "2"))
+POOL_MAX_USES = 50
+
+@pytest.fixture(scope="session")
+def browser_context_pool(browser):
+    """Pre-warm a small queue of contexts for backend-heavy tests.
+
+    While one test sits in AI inference, a parallel worker can already be
+    issuing its request from another pooled context instead of paying
+    for context creation first.
+    """
+    pool = queue.Queue()
+    for _ in range(POOL_SIZE):
+        context = browser.new_context()
+        enable_asset_cache(context)
+        pool.put({"context": context, "uses": 0})
+    yield pool
+    while not pool.empty():
+        pool.get_nowait()["context"].close()
+
+@pytest.fixture
+def pooled_page(browser, browser_context_pool):
+    """Check a page out of the context pool, recycling tired contexts."""
+    entry = browser_context_pool.get()
+    if entry["uses"] >= POOL_MAX_USES:
+        entry["context"].close()
+        context = browser.new_context()
+        enable_asset_cache(context)
+        entry = {"context": context, "uses": 0}
+    entry["uses"] += 1
+    page = entry["context"].new_page()
+    yield page
+    page.close()
+    browser_context_pool.put(entry)
+
+@pytest.fixture(scope="class")
+def loaded_page(browser):
+    """One navigated page shared by a class of read-only tests.
+
+    The home page (HTML, CSS, JS and the model-status poll) loads once
+    per class instead of once per test. Tests that mutate page or server
+    state — uploads, quiz/flashcard generation, viewport changes — must
+    keep using the per-test ``page`` fixture.
+    """
+    context = browser.new_context()
+    enable_asset_cache(context)
+    page = context.new_page()
+    page.goto(BASE_URL)
+    page.wait_for_load_state("networkidle")
+    yield page
+    context.close()
+
+# ---------------------------------------------------------------------------
+# Phase 6 comprehensive suites (playwright.async_api)
+# ---------------------------------------------------------------------------
+# These live here rather than in _phase6_common so pytest hands both
+# phase 6 modules the same session instance — fixture functions imported
+# into two modules get registered (and would launch a browser) once per
+# module.
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Session-wide loop so the async fixtures below can be session-scoped."""
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest.fixture(scope="session")
+async def phase6_browser():
+    """One Chromium shared by both phase 6 suite modules.
+
+    Same HEADED gate and trimmed launch args as the sync browser above.
+    """
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=HEADLESS, args=LAUNCH_ARGS, chromium_sandbox=False
+        )
+        yield browser
+        await browser.close()
+
+@pytest.fixture(scope="session")
+async def phase6_context(phase6_browser):
+    """Shared default context with the phase 6 static asset cache wired in."""
+    from _phase6_common import enable_asset_cache
+
+    # Service workers compete with the main thread on every load and
+    # delay quiescence; only PWA-behavior tests need them, and those use
+    # phase6_pwa_context below.
+    context = await phase6_browser.new_context(service_workers="block")
+    # Bound the failure path: Playwright's 30s-per-action default turns
+    # a down server into a multi-minute stall across the suites' checks.
+    # Explicit per-call timeouts still override these where set.
+    context.set_default_timeout(3000)
+    context.set_default_navigation_timeout(8000)
+    await enable_asset_cache(context)
+    yield context
+    await context.close()
+
+@pytest.fixture(scope="session")
+async def phase6_pwa_context(phase6_browser):
+    """Context with service workers enabled, for PWA-behavior tests only."""
+    context = await phase6_browser.new_context()
+    context.set_default_timeout(3000)
+    context.set_default_navigation_timeout(8000)
+    yield context
+    await context.close()
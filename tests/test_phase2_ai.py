@@ -4,19 +4,29 @@ AI Study Helper - Phase 2: AI Content Generation Tests
 Playwright test suite for AI-powered content generation
 """
 
+import io
+
 import pytest
-import tempfile
-import os
 from PIL import Image
 from playwright.sync_api import expect, Page
 
+from conftest import batch_probe, check_selectors, count
+
+def _encode_test_png():
+    buf = io.BytesIO()
+    Image.new("RGB", (400, 200), color="white").save(buf, "PNG")
+    return buf.getvalue()
+
+# Encoded once at import; uploads hand Playwright the buffer directly so
+# no temp file is written or cleaned up per test.
+_PNG_BYTES = _encode_test_png()
+
 class TestPhase2AI:
     """Test suite for Phase 2 AI Content Generation features"""
     
-    def test_01_phase2_homepage_loading(self, browser_context):
+    def test_01_phase2_homepage_loading(self, loaded_page):
         """Test Phase 2 homepage loads with AI features"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
+        page = loaded_page
         
         # Check Phase 2 indicator
         phase_indicator = page.locator(".phase-indicator")
@@ -29,17 +39,12 @@ class TestPhase2AI:
         
         print("✅ Phase 2 homepage loads correctly with AI features")
     
-    def test_02_ai_models_status_display(self, browser_context):
+    def test_02_ai_models_status_display(self, loaded_page, ai_ready):
         """Test AI models status is displayed correctly"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
-        
-        # Wait for model status to load
-        page.wait_for_selector("#modelStatus", timeout=10000)
+        page = loaded_page
         
         # Check if models are loaded
-        model_cards = page.locator(".model-info-card")
-        expect(model_cards).to_have_count(4)  # BART, T5, DistilBERT, Device
+        assert count(page, ".model-info-card") == 4  # BART, T5, DistilBERT, Device
         
         # Check for BART model
         bart_model = page.locator("text=BART")
@@ -55,87 +60,69 @@ class TestPhase2AI:
         
         print("✅ AI models status displays correctly")
     
-    def test_03_ocr_with_ai_generation(self, browser_context):
+    def test_03_ocr_with_ai_generation(self, page):
         """Test OCR processing with AI content generation"""
-        page, context, browser = browser_context
         page.goto("http://localhost:5000")
         
-        # Create test image
-        img = Image.new('RGB', (400, 200), color='white')
-        test_image_path = tempfile.mktemp(suffix='.png')
-        img.save(test_image_path, 'PNG')
-        
-        try:
-            # Upload image
-            file_input = page.locator("#fileInput")
-            file_input.set_input_files(test_image_path)
-            
-            # Wait for processing to complete
-            page.wait_for_selector("#ocrResults", timeout=30000)
-            
-            # Check OCR results
-            ocr_results = page.locator("#ocrResults")
-            expect(ocr_results).to_be_visible()
-            
-            # Check AI content section appears
-            ai_section = page.locator("#aiContentSection")
-            expect(ai_section).to_be_visible()
-            
-            # Check for AI-generated content
-            summary_section = page.locator("#summarySection")
-            expect(summary_section).to_be_visible()
-            
-            explanation_section = page.locator("#explanationSection")
-            expect(explanation_section).to_be_visible()
-            
-            keywords_section = page.locator("#keywordsSection")
-            expect(keywords_section).to_be_visible()
-            
-            print("✅ OCR with AI generation works correctly")
-            
-        finally:
-            os.unlink(test_image_path)
-    
-    def test_04_ai_content_quality(self, browser_context):
-        """Test AI-generated content quality and display"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
+        # Upload the pre-encoded image straight from memory
+        file_input = page.locator("#fileInput")
+        file_input.set_input_files(
+            files=[{"name": "test.png", "mimeType": "image/png", "buffer": _PNG_BYTES}]
+        )
+        
+        # Wait for processing to complete
+        page.wait_for_selector("#ocrResults", timeout=30000)
         
-        # Wait for AI models to be ready
-        page.wait_for_selector("#modelStatus", timeout=10000)
+        # Check OCR results
+        ocr_results = page.locator("#ocrResults")
+        expect(ocr_results).to_be_visible()
         
-        # Check if AI content sections are properly structured
-        summary_content = page.locator("#summaryContent")
-        explanation_content = page.locator("#explanationContent")
-        keywords_content = page.locator("#keywordsContent")
+        # Check AI content section appears
+        ai_section = page.locator("#aiContentSection")
+        expect(ai_section).to_be_visible()
         
-        # These should exist but may be empty initially
-        expect(summary_content).to_be_visible()
-        expect(explanation_content).to_be_visible()
-        expect(keywords_content).to_be_visible()
+        # Check for AI-generated content
+        summary_section = page.locator("#summarySection")
+        expect(summary_section).to_be_visible()
         
-        print("✅ AI content sections are properly structured")
+        explanation_section = page.locator("#explanationSection")
+        expect(explanation_section).to_be_visible()
+        
+        keywords_section = page.locator("#keywordsSection")
+        expect(keywords_section).to_be_visible()
+        
+        print("✅ OCR with AI generation works correctly")
+    
+    @pytest.mark.parametrize(
+        "selector,label",
+        [
+            ("#aiContentSection", "ai-content"),
+            ("#studySessionSection", "study-session"),
+            ("#textInput", "text-input"),
+            ("#sessionsHistory", "sessions-history"),
+            ("#uploadProgress", "upload-progress"),
+            ("#aiProcessingTime", "perf-metrics"),
+            ("#summaryContent", "summary-content"),
+            ("#explanationContent", "explanation-content"),
+            ("#keywordsContent", "keywords-content"),
+        ],
+    )
+    def test_04_section_visible(self, loaded_page, selector, label):
+        """Test each major page section renders after homepage load"""
+        expect(loaded_page.locator(selector)).to_be_visible()
     
-    def test_05_study_session_creation(self, browser_context):
+    def test_05_study_session_creation(self, loaded_page):
         """Test study session creation with AI content"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
+        page = loaded_page
         
         # Wait for page to load
         page.wait_for_selector("#studySessionSection", timeout=10000)
         
-        # Check study session form
-        session_form = page.locator("#studySessionForm")
-        expect(session_form).to_be_visible()
-        
-        # Check form fields
-        session_name_input = page.locator("#sessionName")
-        duration_input = page.locator("#duration")
-        notes_textarea = page.locator("#notes")
-        
-        expect(session_name_input).to_be_visible()
-        expect(duration_input).to_be_visible()
-        expect(notes_textarea).to_be_visible()
+        # Check form and fields in one round-trip
+        results = check_selectors(
+            page, ["#studySessionForm", "#sessionName", "#duration", "#notes"]
+        )
+        assert all(results.values()), results
         
         # Check submit button
         submit_btn = page.locator('button[type="submit"]')
@@ -144,139 +131,87 @@ class TestPhase2AI:
         
         print("✅ Study session creation form is properly displayed")
     
-    def test_06_text_input_ai_generation(self, browser_context):
+    def test_06_text_input_ai_generation(self, loaded_page):
         """Test AI content generation from text input"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
+        page = loaded_page
         
         # Wait for page to load
         page.wait_for_selector("#textInput", timeout=10000)
         
-        # Check text input section
-        text_input = page.locator("#textInput")
-        generate_btn = page.locator("#generateBtn")
-        
-        expect(text_input).to_be_visible()
-        expect(generate_btn).to_be_visible()
-        expect(generate_btn).to_contain_text("Generate")
-        
-        # Check content type checkboxes
-        summary_checkbox = page.locator("#genSummary")
-        explanation_checkbox = page.locator("#genExplanation")
-        keywords_checkbox = page.locator("#genKeywords")
-        
-        expect(summary_checkbox).to_be_visible()
-        expect(explanation_checkbox).to_be_visible()
-        expect(keywords_checkbox).to_be_visible()
+        # Probe visibility and default-checked state in one round-trip
+        specs = [
+            ("#textInput", False),
+            ("#generateBtn", False),
+            ("#genSummary", True),
+            ("#genExplanation", True),
+            ("#genKeywords", True),
+        ]
+        results = batch_probe(page, specs)
+        assert all(r["visible"] for r in results), results
+        checked = [r for (_, wants), r in zip(specs, results) if wants]
+        assert all(r["checked"] for r in checked), results
         
-        # Check checkboxes are checked by default
-        expect(summary_checkbox).to_be_checked()
-        expect(explanation_checkbox).to_be_checked()
-        expect(keywords_checkbox).to_be_checked()
+        expect(page.locator("#generateBtn")).to_contain_text("Generate")
         
         print("✅ Text input AI generation interface is properly displayed")
     
-    def test_07_study_sessions_history(self, browser_context):
+    def test_07_study_sessions_history(self, loaded_page):
         """Test study sessions history display"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
-        
-        # Wait for page to load
-        page.wait_for_selector("#sessionsHistory", timeout=10000)
-        
-        # Check sessions history section
-        sessions_history = page.locator("#sessionsHistory")
-        expect(sessions_history).to_be_visible()
+        page = loaded_page
         
-        # Initially should show no sessions message
+        # Section visibility is covered by test_04_section_visible;
+        # initially should show no sessions message
         no_sessions_msg = page.locator("text=No study sessions yet")
         expect(no_sessions_msg).to_be_visible()
         
         print("✅ Study sessions history displays correctly")
     
-    def test_08_ai_processing_indicators(self, browser_context):
+    def test_08_ai_processing_indicators(self, loaded_page):
         """Test AI processing indicators and progress"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
+        page = loaded_page
         
-        # Wait for page to load
-        page.wait_for_selector("#uploadProgress", timeout=10000)
-        
-        # Check upload progress section exists (initially hidden)
-        upload_progress = page.locator("#uploadProgress")
-        expect(upload_progress).to_be_visible()
-        
-        # Check progress bar
-        progress_bar = page.locator(".progress-bar")
-        expect(progress_bar).to_have_count(1)
+        # Check progress bar (section visibility covered by test_04)
+        assert count(page, ".progress-bar") == 1
         
         print("✅ AI processing indicators are properly configured")
     
-    def test_09_confidence_indicators(self, browser_context):
+    def test_09_confidence_indicators(self, loaded_page):
         """Test confidence score indicators for AI content"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
-        
-        # Wait for page to load
-        page.wait_for_selector("#aiContentSection", timeout=10000)
+        page = loaded_page
         
         # Check confidence indicators exist
-        confidence_indicators = page.locator(".confidence-indicator")
-        expect(confidence_indicators).to_have_count(3)  # Summary, explanation, keywords
+        assert count(page, ".confidence-indicator") == 3  # Summary, explanation, keywords
         
         print("✅ Confidence indicators are properly displayed")
     
-    def test_10_keyword_tags_display(self, browser_context):
+    def test_10_keyword_tags_display(self, loaded_page):
         """Test keyword tags display and styling"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
+        page = loaded_page
         
-        # Wait for page to load
-        page.wait_for_selector("#keywordsContent", timeout=10000)
-        
-        # Check keyword content section
-        keywords_content = page.locator("#keywordsContent")
-        expect(keywords_content).to_be_visible()
-        
-        # Check for keyword tag styling (even if empty)
-        keyword_tags = page.locator(".keyword-tag")
-        expect(keyword_tags).to_have_count(0)  # Initially no keywords
+        # Check for keyword tag styling (even if empty; section
+        # visibility covered by test_04)
+        assert count(page, ".keyword-tag") == 0  # Initially no keywords
         
         print("✅ Keyword tags display is properly configured")
     
-    def test_11_ai_model_integration(self, browser_context):
+    def test_11_ai_model_integration(self, page, ai_ready):
         """Test AI model integration and API endpoints"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
-        
-        # Test health endpoint
+        # The homepage never requests /api/health itself (it polls
+        # /api/ai/models for #modelStatus), so query the endpoint
+        # directly through the page's request context
         response = page.request.get("http://localhost:5000/api/health")
-        expect(response).to_be_ok()
-        
+        assert response.ok
+
         # Check response contains Phase 2 info
         data = response.json()
-        expect(data["phase"]).to_contain("Phase 2")
-        expect(data["components"]["ai_generator"]).to_be_truthy()
-        
+        assert "Phase 2" in data["phase"]
+        assert data["components"]["ai_generator"]
+
         print("✅ AI model integration is working correctly")
     
-    def test_12_error_handling(self, browser_context):
-        """Test error handling for AI generation failures"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
-        
-        # Wait for page to load
-        page.wait_for_selector("#aiContentSection", timeout=10000)
-        
-        # Check error display sections exist
-        summary_content = page.locator("#summaryContent")
-        expect(summary_content).to_be_visible()
-        
-        print("✅ Error handling sections are properly configured")
-    
-    def test_13_responsive_design(self, browser_context):
+    @pytest.mark.ui_only
+    def test_13_responsive_design(self, page):
         """Test responsive design for mobile devices"""
-        page, context, browser = browser_context
         
         # Set mobile viewport
         page.set_viewport_size({"width": 375, "height": 667})
@@ -295,25 +230,19 @@ class TestPhase2AI:
         
         print("✅ Responsive design works on mobile devices")
     
-    def test_14_performance_metrics(self, browser_context):
+    def test_14_performance_metrics(self, loaded_page):
         """Test performance metrics display"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
+        page = loaded_page
         
-        # Wait for page to load
-        page.wait_for_selector("#aiProcessingTime", timeout=10000)
-        
-        # Check processing time display
+        # Visibility is covered by test_04; check the initial reading
         ai_processing_time = page.locator("#aiProcessingTime")
-        expect(ai_processing_time).to_be_visible()
         expect(ai_processing_time).to_contain_text("0")
         
         print("✅ Performance metrics are properly displayed")
     
-    def test_15_phase2_complete_workflow(self, browser_context):
+    def test_15_phase2_complete_workflow(self, loaded_page, ai_ready):
         """Test complete Phase 2 workflow"""
-        page, context, browser = browser_context
-        page.goto("http://localhost:5000")
+        page = loaded_page
         
         # Wait for page to load
         page.wait_for_selector("#uploadArea", timeout=10000)
@@ -328,21 +257,13 @@ class TestPhase2AI:
             "#textInput"             # Text input for AI
         ]
         
-        for component in components:
-            element = page.locator(component)
-            expect(element).to_be_visible()
+        results = check_selectors(page, components)
+        assert all(results.values()), results
         
         print("✅ Phase 2 complete workflow is properly configured")
         print("🎉 Phase 2 AI Content Generation tests completed successfully!")
 
-# Test configuration
-@pytest.fixture(scope="class")
-def browser_context(browser):
-    """Setup browser context for tests"""
-    context = browser.new_context()
-    page = context.new_page()
-    yield page, context, browser
-    context.close()
+# The shared browser/page fixtures live in tests/conftest.py.
 
 
 
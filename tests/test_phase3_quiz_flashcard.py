@@ -4,30 +4,69 @@ Tests the complete quiz and flashcard functionality
 """
 
 import pytest
-from playwright.sync_api import sync_playwright, expect
-import time
-import json
+from playwright.sync_api import expect
+
+from conftest import count
+
+# Sample passages for the generation tests, built once at import so the
+# pre-generated quiz snapshot below can reuse them.
+SAMPLES = {
+    "photosynthesis": """
+        Photosynthesis is the process by which plants convert light energy into chemical energy.
+        This process occurs in the chloroplasts of plant cells and requires carbon dioxide, water, and sunlight.
+        The end products are glucose and oxygen, which are essential for plant growth and survival.
+        """,
+    "heart": """
+        The human heart has four chambers: two atria and two ventricles.
+        The right side pumps blood to the lungs for oxygenation.
+        The left side pumps oxygenated blood to the body.
+        The heart beats approximately 60-100 times per minute at rest.
+        """,
+    "solar_system": """
+        The solar system consists of the Sun and the objects that orbit it.
+        There are eight planets: Mercury, Venus, Earth, Mars, Jupiter, Saturn, Uranus, and Neptune.
+        Pluto was reclassified as a dwarf planet in 2006.
+        The asteroid belt is located between Mars and Jupiter.
+        """,
+    "python": """
+        Python is a high-level programming language known for its simplicity.
+        It supports multiple programming paradigms including procedural, object-oriented, and functional.
+        Python has a large standard library and extensive third-party packages.
+        It's widely used in data science, web development, and automation.
+        """,
+}
 
 class TestPhase3QuizFlashcard:
     """Test suite for Phase 3 Quiz & Flashcard functionality"""
     
+    # Uses the session-scoped browser and per-test page from tests/conftest.py.
+
     @pytest.fixture(scope="class")
-    def browser_context(self):
-        """Setup browser context for all tests"""
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            context = browser.new_context()
-            page = context.new_page()
-            yield page
-            context.close()
-            browser.close()
-    
-    def test_phase3_homepage_loads(self, browser_context):
-        """Test that Phase 3 homepage loads with quiz and flashcard features"""
-        page = browser_context
-        
-        # Navigate to the application
+    def pre_generated_quiz(self, browser):
+        """Generate one quiz and keep the generating page alive.
+
+        The backend generation call is the expensive step; tests that
+        just need a quiz on screen reuse this live page. The quiz state
+        only lives in the page's script scope (currentQuiz), so a saved
+        HTML snapshot would lose it — restoring one re-runs the inline
+        scripts and resets the variable.
+        """
+        context = browser.new_context()
+        page = context.new_page()
         page.goto("http://localhost:5000")
+        page.wait_for_selector("#textInput", state="visible")
+        page.fill("#textInput", SAMPLES["solar_system"])
+        page.select_option("#subjectInput", "Astronomy")
+        page.select_option("#difficultyInput", "easy")
+        with page.expect_response(lambda r: "/api/quiz/generate" in r.url and r.status == 200):
+            page.click("text=Generate Quiz")
+        page.wait_for_selector("#quizSection", state="visible", timeout=15000)
+        yield page
+        context.close()
+
+    def test_phase3_homepage_loads(self, loaded_page):
+        """Test that Phase 3 homepage loads with quiz and flashcard features"""
+        page = loaded_page
         
         # Check that the main interface elements are present
         expect(page.locator("text=Upload Image for OCR + AI + Quiz Generation")).to_be_visible()
@@ -35,36 +74,29 @@ class TestPhase3QuizFlashcard:
         
         print("✓ Phase 3 homepage loaded successfully with quiz and flashcard features")
     
-    def test_quiz_generation_from_text(self, browser_context):
+    def test_quiz_generation_from_text(self, pooled_page):
         """Test quiz generation from direct text input"""
-        page = browser_context
-        
+        page = pooled_page
         # Navigate to the application
         page.goto("http://localhost:5000")
         
-        # Wait for page to load
-        page.wait_for_load_state("networkidle")
+        # Wait for the form, not network quiescence — the page keeps
+        # polling the backend so "networkidle" may never settle
+        page.wait_for_selector("#textInput", state="visible")
         
         # Enter sample text for quiz generation
-        sample_text = """
-        Photosynthesis is the process by which plants convert light energy into chemical energy.
-        This process occurs in the chloroplasts of plant cells and requires carbon dioxide, water, and sunlight.
-        The end products are glucose and oxygen, which are essential for plant growth and survival.
-        """
-        
-        page.fill("#textInput", sample_text)
+        page.fill("#textInput", SAMPLES["photosynthesis"])
         
         # Set subject and difficulty
         page.select_option("#subjectInput", "Biology")
         page.select_option("#difficultyInput", "medium")
         
-        # Click generate quiz button
-        page.click("text=Generate Quiz")
-        
-        # Wait for quiz generation
-        page.wait_for_timeout(3000)
+        # Click generate quiz and wait for the backend response, not a timer
+        with page.expect_response(lambda r: "/api/quiz/generate" in r.url and r.status == 200):
+            page.click("text=Generate Quiz")
         
         # Check that quiz section appears
+        page.wait_for_selector("#quizSection", state="visible", timeout=15000)
         expect(page.locator("#quizSection")).to_be_visible()
         expect(page.locator("text=Generated 5 questions")).to_be_visible()
         
@@ -73,37 +105,29 @@ class TestPhase3QuizFlashcard:
         
         print("✓ Quiz generation from text input successful")
     
-    def test_flashcard_generation_from_text(self, browser_context):
+    def test_flashcard_generation_from_text(self, pooled_page):
         """Test flashcard generation from direct text input"""
-        page = browser_context
-        
+        page = pooled_page
         # Navigate to the application
         page.goto("http://localhost:5000")
         
-        # Wait for page to load
-        page.wait_for_load_state("networkidle")
+        # Wait for the form, not network quiescence — the page keeps
+        # polling the backend so "networkidle" may never settle
+        page.wait_for_selector("#textInput", state="visible")
         
         # Enter sample text for flashcard generation
-        sample_text = """
-        The human heart has four chambers: two atria and two ventricles.
-        The right side pumps blood to the lungs for oxygenation.
-        The left side pumps oxygenated blood to the body.
-        The heart beats approximately 60-100 times per minute at rest.
-        """
-        
-        page.fill("#textInput", sample_text)
+        page.fill("#textInput", SAMPLES["heart"])
         
         # Set subject and difficulty
         page.select_option("#subjectInput", "Biology")
         page.select_option("#difficultyInput", "easy")
         
-        # Click generate flashcards button
-        page.click("text=Generate Flashcards")
-        
-        # Wait for flashcard generation
-        page.wait_for_timeout(3000)
+        # Click generate flashcards and wait for the backend response
+        with page.expect_response(lambda r: "/api/flashcards/generate" in r.url and r.status == 200):
+            page.click("text=Generate Flashcards")
         
         # Check that flashcard section appears
+        page.wait_for_selector("#flashcardSection", state="visible", timeout=15000)
         expect(page.locator("#flashcardSection")).to_be_visible()
         expect(page.locator("text=Generated 4 flashcards")).to_be_visible()
         
@@ -113,82 +137,55 @@ class TestPhase3QuizFlashcard:
         
         print("✓ Flashcard generation from text input successful")
     
-    def test_quiz_taking_functionality(self, browser_context):
+    def test_quiz_taking_functionality(self, pre_generated_quiz):
         """Test the complete quiz taking experience"""
-        page = browser_context
-        
-        # Navigate to the application
-        page.goto("http://localhost:5000")
-        
-        # Generate a quiz first
-        sample_text = """
-        The solar system consists of the Sun and the objects that orbit it.
-        There are eight planets: Mercury, Venus, Earth, Mars, Jupiter, Saturn, Uranus, and Neptune.
-        Pluto was reclassified as a dwarf planet in 2006.
-        The asteroid belt is located between Mars and Jupiter.
-        """
-        
-        page.fill("#textInput", sample_text)
-        page.select_option("#subjectInput", "Astronomy")
-        page.select_option("#difficultyInput", "easy")
-        page.click("text=Generate Quiz")
-        
-        # Wait for quiz generation
-        page.wait_for_timeout(3000)
-        
+        # Reuse the live page that generated the quiz — no second
+        # backend call, and currentQuiz is still loaded in-page
+        page = pre_generated_quiz
+
         # Start the quiz
         page.click("text=Start Quiz")
-        
-        # Wait for quiz to start
-        page.wait_for_timeout(1000)
-        
-        # Check that quiz interface is visible
-        expect(page.locator("#quizInterface")).to_be_visible()
+
+        # Check that the quiz-taking interface is visible
+        page.wait_for_selector("#quizTakingSection", state="visible")
+        expect(page.locator("#quizTakingSection")).to_be_visible()
         expect(page.locator("text=Question 1 of")).to_be_visible()
-        
-        # Answer the first question (assuming multiple choice)
-        page.click("input[type='radio']:first-child")
-        
+
+        # Answer the first question: pick an option for choice-based
+        # questions, otherwise type into the short-answer box
+        options = page.locator(".question-option")
+        if options.count() > 0:
+            options.first.click()
+        else:
+            page.fill("#shortAnswerInput", "answer")
+
         # Submit answer
         page.click("text=Submit Answer")
-        
-        # Wait for next question or results
-        page.wait_for_timeout(1000)
-        
+
         print("✓ Quiz taking functionality working correctly")
     
-    def test_flashcard_review_functionality(self, browser_context):
+    def test_flashcard_review_functionality(self, pooled_page):
         """Test the flashcard review system"""
-        page = browser_context
-        
+        page = pooled_page
         # Navigate to the application
         page.goto("http://localhost:5000")
         
         # Generate flashcards first
-        sample_text = """
-        Python is a high-level programming language known for its simplicity.
-        It supports multiple programming paradigms including procedural, object-oriented, and functional.
-        Python has a large standard library and extensive third-party packages.
-        It's widely used in data science, web development, and automation.
-        """
-        
-        page.fill("#textInput", sample_text)
+        page.fill("#textInput", SAMPLES["python"])
         page.select_option("#subjectInput", "Computer Science")
         page.select_option("#difficultyInput", "medium")
-        page.click("text=Generate Flashcards")
-        
-        # Wait for flashcard generation
-        page.wait_for_timeout(3000)
+        with page.expect_response(lambda r: "/api/flashcards/generate" in r.url and r.status == 200):
+            page.click("text=Generate Flashcards")
         
         # Check that flashcards are generated
-        expect(page.locator("#flashcardSection")).to_be_visible()
+        page.wait_for_selector("#flashcardSection", state="visible", timeout=15000)
         
-        # Navigate through flashcards
+        # Navigate through flashcards; the card re-renders synchronously
         page.click("text=Next")
-        page.wait_for_timeout(500)
+        page.wait_for_selector(".flashcard-question", state="visible")
         
         page.click("text=Previous")
-        page.wait_for_timeout(500)
+        page.wait_for_selector(".flashcard-question", state="visible")
         
         # Check that flashcard content is visible
         expect(page.locator(".flashcard-question")).to_be_visible()
@@ -196,12 +193,9 @@ class TestPhase3QuizFlashcard:
         
         print("✓ Flashcard review functionality working correctly")
     
-    def test_ocr_to_quiz_pipeline(self, browser_context):
+    def test_ocr_to_quiz_pipeline(self, loaded_page):
         """Test the complete OCR to quiz generation pipeline"""
-        page = browser_context
-        
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = loaded_page
         
         # Check that OCR upload is available
         expect(page.locator("input[type='file']")).to_be_visible()
@@ -212,59 +206,53 @@ class TestPhase3QuizFlashcard:
         
         print("✓ OCR to quiz pipeline interface is properly set up")
     
-    def test_subject_and_difficulty_selection(self, browser_context):
+    def test_subject_and_difficulty_selection(self, loaded_page):
         """Test subject and difficulty selection for quiz/flashcard generation"""
-        page = browser_context
-        
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = loaded_page
         
         # Check that subject selection is available
         expect(page.locator("#subjectInput")).to_be_visible()
         
         # Check available subjects
-        subjects = page.locator("#subjectInput option")
-        expect(subjects).to_have_count(6)  # Should have 6 subjects
+        assert count(page, "#subjectInput option") == 6  # Should have 6 subjects
         
         # Check that difficulty selection is available
         expect(page.locator("#difficultyInput")).to_be_visible()
         
         # Check available difficulties
-        difficulties = page.locator("#difficultyInput option")
-        expect(difficulties).to_have_count(3)  # Should have 3 difficulty levels
+        assert count(page, "#difficultyInput option") == 3  # Should have 3 difficulty levels
         
         print("✓ Subject and difficulty selection working correctly")
     
-    def test_error_handling(self, browser_context):
+    @pytest.mark.ui_only
+    def test_error_handling(self, page):
         """Test error handling for invalid inputs"""
-        page = browser_context
-        
         # Navigate to the application
         page.goto("http://localhost:5000")
         
         # Try to generate quiz without text
         page.click("text=Generate Quiz")
         
-        # Check that appropriate error message is shown
-        page.wait_for_timeout(1000)
-        
         # Check for error message (this might vary based on implementation)
         error_elements = page.locator(".error-message, .alert, .text-danger")
+        try:
+            error_elements.first.wait_for(state="visible", timeout=3000)
+        except Exception:
+            pass
         if error_elements.count() > 0:
             print("✓ Error handling for empty input working correctly")
         else:
             print("⚠ Error handling may need improvement")
     
-    def test_responsive_design(self, browser_context):
+    @pytest.mark.ui_only
+    def test_responsive_design(self, page):
         """Test that the interface is responsive"""
-        page = browser_context
-        
         # Navigate to the application
         page.goto("http://localhost:5000")
         
-        # Test mobile viewport
+        # Test mobile viewport; media-query re-evaluation needs no reload
         page.set_viewport_size({"width": 375, "height": 667})
-        page.wait_for_timeout(1000)
+        page.wait_for_function("window.matchMedia('(max-width: 500px)').matches")
         
         # Check that elements are still visible and accessible
         expect(page.locator("text=Upload Image for OCR + AI + Quiz Generation")).to_be_visible()
@@ -272,7 +260,7 @@ class TestPhase3QuizFlashcard:
         
         # Test tablet viewport
         page.set_viewport_size({"width": 768, "height": 1024})
-        page.wait_for_timeout(1000)
+        page.wait_for_function("window.matchMedia('(min-width: 700px)').matches")
         
         # Check that elements are still visible
         expect(page.locator("text=Upload Image for OCR + AI + Quiz Generation")).to_be_visible()
@@ -283,57 +271,17 @@ class TestPhase3QuizFlashcard:
         print("✓ Responsive design working correctly")
 
 def main():
-    """Run all Phase 3 tests"""
+    """Run all Phase 3 tests in parallel.
+
+    The suite is written against Playwright's sync API, which cannot be
+    driven concurrently from one asyncio event loop; pytest-xdist worker
+    processes give the same cross-context parallelism, so wall time
+    tracks the slowest test instead of the sum of all nine.
+    """
     print("Running Phase 3: Quiz & Flashcard System Tests")
     print("=" * 60)
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-        
-        test_suite = TestPhase3QuizFlashcard()
-        
-        try:
-            # Test homepage loading
-            test_suite.test_phase3_homepage_loads(page)
-            
-            # Test quiz generation
-            test_suite.test_quiz_generation_from_text(page)
-            
-            # Test flashcard generation
-            test_suite.test_flashcard_generation_from_text(page)
-            
-            # Test quiz taking
-            test_suite.test_quiz_taking_functionality(page)
-            
-            # Test flashcard review
-            test_suite.test_flashcard_review_functionality(page)
-            
-            # Test OCR pipeline
-            test_suite.test_ocr_to_quiz_pipeline(page)
-            
-            # Test subject/difficulty selection
-            test_suite.test_subject_and_difficulty_selection(page)
-            
-            # Test error handling
-            test_suite.test_error_handling(page)
-            
-            # Test responsive design
-            test_suite.test_responsive_design(page)
-            
-            print("\nAll Phase 3 tests completed successfully!")
-            print("Quiz & Flashcard System is fully functional!")
-            
-        except Exception as e:
-            print(f"\nTest failed: {e}")
-            return False
-        
-        finally:
-            context.close()
-            browser.close()
-        
-        return True
+    return pytest.main([__file__, "-n", "auto"]) == 0
 
 if __name__ == "__main__":
-    main()
+    import sys
+    sys.exit(0 if main() else 1)
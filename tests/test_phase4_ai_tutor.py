@@ -1,467 +1,420 @@
 """
 Phase 4: AI Tutor & Mind Maps Tests
 Tests the complete AI Tutor and Mind Map functionality
+
+Tests are independent (each navigates fresh on its own context) and run
+in parallel with pytest-xdist: pytest tests/test_phase4_ai_tutor.py -n auto
 """
 
+import asyncio
+import os
+
 import pytest
-from playwright.sync_api import sync_playwright, expect
-import time
-import json
+from playwright.async_api import async_playwright, expect
+
+from conftest import LAUNCH_ARGS
+
+# Auto-waiting assertions poll until the DOM settles; 5 s is plenty for
+# the rule-based Phase 4 backend and far cheaper than fixed sleeps.
+expect.set_options(timeout=5000)
+
+# This module drives Playwright's async API (pytest-asyncio with
+# asyncio_mode = auto) so navigation and network waits overlap on one
+# event loop. The fixtures below shadow the sync ones from conftest.py.
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Session-wide loop so the async browser fixture can be session-scoped."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest.fixture(scope="session")
+async def async_browser():
+    """Launch one async Chromium per session (per xdist worker)."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=os.environ.get("HEADED") != "1",
+            args=LAUNCH_ARGS,
+            chromium_sandbox=False,
+        )
+        yield browser
+        await browser.close()
+
+@pytest.fixture
+async def context(async_browser):
+    """Fresh BrowserContext per test — clean cookies/storage at ~context
+    cost instead of a browser launch."""
+    context = await async_browser.new_context(viewport={"width": 1280, "height": 720})
+    yield context
+    await context.close()
+
+@pytest.fixture
+async def page(context):
+    """Page on the per-test context."""
+    return await context.new_page()
+
+@pytest.fixture
+async def stub_apis(context):
+    """Serve empty JSON for every /api/ call.
+
+    For tests that only assert DOM structure — page render no longer
+    blocks on the real gamification/stats backend. List before ``home``
+    so the route is in place ahead of navigation.
+    """
+    await context.route(
+        "**/api/**",
+        lambda route: route.fulfill(
+            status=200, body="{}", content_type="application/json"
+        ),
+    )
+
+@pytest.fixture
+async def home(page):
+    """Per-test page already navigated to the app's entry point."""
+    await page.goto("http://localhost:5000", wait_until="domcontentloaded")
+    return page
+
+
+async def _submit_mind_map(page, title, subject, content):
+    """Fill the mind-map form and click Generate in one CDP round-trip."""
+    await page.evaluate(
+        """(data) => {
+            document.getElementById('mindMapTitle').value = data.title;
+            document.getElementById('mindMapSubject').value = data.subject;
+            document.getElementById('mindMapContent').value = data.content;
+            const btn = [...document.querySelectorAll('button')]
+                .find(b => b.textContent.includes('Generate Mind Map'));
+            btn.click();
+        }""",
+        {"title": title, "subject": subject, "content": content},
+    )
 
 class TestPhase4AITutor:
     """Test suite for Phase 4 AI Tutor and Mind Maps functionality"""
 
-    @pytest.fixture(scope="class")
-    def browser_context(self):
-        """Setup browser context for all tests"""
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            context = browser.new_context()
-            page = context.new_page()
-            yield page
-            context.close()
-            browser.close()
-
-    def test_phase4_homepage_loads(self, browser_context):
+    async def test_phase4_homepage_loads(self, home):
         """Test that Phase 5 homepage loads with AI Tutor and Mind Map features"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
-
-        # Check that Phase 5 title is displayed
-        expect(page.locator("text=Phase 5: AI Tutor & Mind Maps")).to_be_visible()
-
-        # Check that all phase badges are present
-        expect(page.locator("text=OCR System")).to_be_visible()
-        expect(page.locator("text=AI Content")).to_be_visible()
-        expect(page.locator("text=Quiz System")).to_be_visible()
-        expect(page.locator("text=Flashcards")).to_be_visible()
-        expect(page.locator("text=AI Tutor")).to_be_visible()
-        expect(page.locator("text=Mind Maps")).to_be_visible()
-
-        # Check that the main interface elements are present
-        expect(page.locator("text=Image Upload & OCR")).to_be_visible()
-        expect(page.locator("text=Quiz & Flashcards")).to_be_visible()
-        expect(page.locator("text=AI Tutor - Your Personal Learning Assistant")).to_be_visible()
-        expect(page.locator("text=Mind Maps - Visual Learning")).to_be_visible()
-
-        print("✓ Phase 5 homepage loaded successfully with AI Tutor and Mind Map features")
-
-    def test_ai_tutor_session_creation(self, browser_context):
+        page = home
+
+        # Anchor on the title, then sweep the static banner strings in a
+        # single evaluate instead of one full-document text scan each
+        await expect(page.locator("text=Phase 5: AI Tutor & Mind Maps")).to_be_visible()
+
+        texts = [
+            "OCR System",
+            "AI Content",
+            "Quiz System",
+            "Flashcards",
+            "AI Tutor",
+            "Mind Maps",
+            "Image Upload & OCR",
+            "Quiz & Flashcards",
+            "AI Tutor - Your Personal Learning Assistant",
+            "Mind Maps - Visual Learning",
+        ]
+        missing = await page.evaluate(
+            "(texts) => texts.filter(t => !document.body.innerText.includes(t))",
+            texts,
+        )
+        assert missing == [], f"Missing homepage text: {missing}"
+
+
+    async def test_ai_tutor_session_creation(self, home):
         """Test AI Tutor session creation functionality"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = home
 
         # Select subject and difficulty
-        page.select_option("#tutorSubject", "Mathematics")
-        page.select_option("#tutorDifficulty", "intermediate")
+        await page.select_option("#tutorSubject", "Mathematics")
+        await page.select_option("#tutorDifficulty", "intermediate")
 
         # Click start session button
-        page.click("text=Start Session")
+        await page.click("text=Start Session")
 
         # Wait for session to be created and chat container to appear
-        expect(page.locator("#chatContainer")).to_be_visible()
-        expect(page.locator("#tutorWelcome")).not_to_be_visible()
+        await expect(page.locator("#chatContainer")).to_be_visible()
+        await expect(page.locator("#tutorWelcome")).not_to_be_visible()
 
         # Check that welcome message appears
-        expect(page.locator("text=Hello! I'm your Mathematics tutor")).to_be_visible()
+        await expect(page.locator("text=Hello! I'm your Mathematics tutor")).to_be_visible()
 
-        print("✓ AI Tutor session created successfully")
 
-    def test_ai_tutor_chat_functionality(self, browser_context):
+    async def test_ai_tutor_chat_functionality(self, home):
         """Test AI Tutor chat messaging functionality"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = home
 
         # Start a tutor session
-        page.select_option("#tutorSubject", "Science")
-        page.select_option("#tutorDifficulty", "beginner")
-        page.click("text=Start Session")
+        await page.select_option("#tutorSubject", "Science")
+        await page.select_option("#tutorDifficulty", "beginner")
+        await page.click("text=Start Session")
 
         # Wait for chat container
-        expect(page.locator("#chatContainer")).to_be_visible()
+        await expect(page.locator("#chatContainer")).to_be_visible()
 
         # Send a message
-        page.fill("#chatInput", "What is photosynthesis?")
-        page.click("text=Send")
-
-        # Wait for AI response
-        time.sleep(2)
+        await page.fill("#chatInput", "What is photosynthesis?")
+        await page.click("text=Send")
 
+        # The expects below auto-wait for the AI response to render.
         # Check that both user and AI messages are visible
-        expect(page.locator("text=What is photosynthesis?")).to_be_visible()
-        expect(page.locator("text=AI Tutor:")).to_be_visible()
+        await expect(page.locator("text=What is photosynthesis?")).to_be_visible()
+        await expect(page.locator("text=AI Tutor:")).to_be_visible()
 
-        print("✓ AI Tutor chat functionality working correctly")
 
-    def test_mind_map_creation(self, browser_context):
+    async def test_mind_map_creation(self, home):
         """Test Mind Map creation functionality"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
-
-        # Fill mind map form
-        page.fill("#mindMapTitle", "Biology Basics")
-        page.select_option("#mindMapSubject", "Science")
-        page.fill("#mindMapContent", "Biology is the study of living organisms. It includes cell biology, genetics, ecology, and evolution. Cells are the basic units of life. DNA contains genetic information.")
-
-        # Click generate mind map button
-        page.click("text=Generate Mind Map")
+        page = home
 
-        # Wait for mind map to be generated
-        time.sleep(2)
+        # Fill and submit the mind map form in one round-trip
+        await _submit_mind_map(
+            page,
+            "Biology Basics",
+            "Science",
+            "Biology is the study of living organisms. It includes cell biology, genetics, ecology, and evolution. Cells are the basic units of life. DNA contains genetic information.",
+        )
 
-        # Check that mind map visualization appears
-        expect(page.locator("text=Science")).to_be_visible()
-        expect(page.locator("text=Biology Basics")).to_be_visible()
+        # Check that mind map visualization appears (expect auto-waits)
+        await expect(page.locator("text=Science")).to_be_visible()
+        await expect(page.locator("text=Biology Basics")).to_be_visible()
 
-        print("✓ Mind Map created successfully")
 
-    def test_mind_map_visualization(self, browser_context):
+    async def test_mind_map_visualization(self, home):
         """Test Mind Map visualization and node display"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = home
 
         # Create a mind map with specific content
-        page.fill("#mindMapTitle", "Math Concepts")
-        page.select_option("#mindMapSubject", "Mathematics")
-        page.fill("#mindMapContent", "Mathematics includes algebra, geometry, calculus, and statistics. Algebra deals with equations and variables. Geometry studies shapes and spaces. Calculus explores rates of change.")
-
-        # Generate mind map
-        page.click("text=Generate Mind Map")
+        await _submit_mind_map(
+            page,
+            "Math Concepts",
+            "Mathematics",
+            "Mathematics includes algebra, geometry, calculus, and statistics. Algebra deals with equations and variables. Geometry studies shapes and spaces. Calculus explores rates of change.",
+        )
 
-        # Wait for generation
-        time.sleep(2)
+        # Wait for the nodes to render, then assert
+        await page.wait_for_selector(".mind-map-node", timeout=5000)
 
         # Check that central node is visible
-        expect(page.locator("text=Mathematics")).to_be_visible()
+        await expect(page.locator("text=Mathematics")).to_be_visible()
 
-        # Check that concept nodes are created
-        expect(page.locator(".mind-map-node")).to_have_count(greater_than(1))
+        # Check that concept nodes are created beyond the central one
+        await page.wait_for_function(
+            "document.querySelectorAll('.mind-map-node').length >= 2", timeout=3000
+        )
+        assert await page.locator(".mind-map-node").count() >= 2
 
-        print("✓ Mind Map visualization working correctly")
 
-    def test_ocr_to_mind_map_workflow(self, browser_context):
+    async def test_ocr_to_mind_map_workflow(self, home):
         """Test complete workflow from OCR to Mind Map creation"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = home
 
         # Simulate OCR results (since we can't actually upload files in tests)
-        page.evaluate("""
+        await page.evaluate("""
             document.getElementById('extractedText').textContent = 'Physics is the study of matter and energy. It includes mechanics, thermodynamics, electromagnetism, and quantum physics. Newton\'s laws describe motion. Energy cannot be created or destroyed.';
             document.getElementById('ocrResults').style.display = 'block';
             document.getElementById('mindMapContent').value = 'Physics is the study of matter and energy. It includes mechanics, thermodynamics, electromagnetism, and quantum physics. Newton\'s laws describe motion. Energy cannot be created or destroyed.';
         """)
 
         # Check that OCR results are displayed
-        expect(page.locator("#ocrResults")).to_be_visible()
-
-        # Create mind map from OCR content
-        page.fill("#mindMapTitle", "Physics Concepts")
-        page.select_option("#mindMapSubject", "Science")
-        page.click("text=Generate Mind Map")
-
-        # Wait for generation
-        time.sleep(2)
+        await expect(page.locator("#ocrResults")).to_be_visible()
+
+        # Create mind map from the OCR content already in the form
+        await page.evaluate("""
+            document.getElementById('mindMapTitle').value = 'Physics Concepts';
+            document.getElementById('mindMapSubject').value = 'Science';
+            [...document.querySelectorAll('button')]
+                .find(b => b.textContent.includes('Generate Mind Map')).click();
+        """)
 
-        # Check that mind map is created
-        expect(page.locator("text=Science")).to_be_visible()
-        expect(page.locator("text=Physics Concepts")).to_be_visible()
+        # Check that mind map is created (expect auto-waits)
+        await expect(page.locator("text=Science")).to_be_visible()
+        await expect(page.locator("text=Physics Concepts")).to_be_visible()
 
-        print("✓ OCR to Mind Map workflow working correctly")
 
-    def test_quiz_generation_from_content(self, browser_context):
+    async def test_quiz_generation_from_content(self, context):
         """Test quiz generation from content"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
-
-        # Fill content for quiz generation
-        page.fill("#mindMapContent", "Chemistry is the study of matter and its properties. Atoms are the building blocks of matter. Chemical reactions involve the rearrangement of atoms. The periodic table organizes elements by their properties.")
-
-        # Select quiz parameters
-        page.select_option("#quizSubject", "Science")
-        page.select_option("#quizDifficulty", "medium")
-
-        # Generate quiz
-        page.click("text=Generate Quiz")
-
-        # Wait for response
-        time.sleep(2)
-
-        # Check that quiz generation was successful (should show alert)
-        # Note: In real testing, we'd check the actual API response
-        print("✓ Quiz generation from content working correctly")
-
-    def test_flashcard_generation_from_content(self, browser_context):
+        # Pure backend wiring — post to the API directly instead of
+        # driving the form through the renderer
+        response = await context.request.post(
+            "http://localhost:5000/api/quiz/generate",
+            data={
+                "content": "Chemistry is the study of matter and its properties. Atoms are the building blocks of matter. Chemical reactions involve the rearrangement of atoms. The periodic table organizes elements by their properties.",
+                "subject": "Science",
+                "difficulty": "medium",
+            },
+        )
+        assert response.ok
+        data = await response.json()
+        assert data.get("success") is True, data
+        assert data.get("quiz_questions"), data
+
+    async def test_flashcard_generation_from_content(self, context):
         """Test flashcard generation from content"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
-
-        # Fill content for flashcard generation
-        page.fill("#mindMapContent", "History is the study of past events. Ancient civilizations include Egypt, Greece, and Rome. The Middle Ages followed the fall of Rome. The Renaissance brought cultural revival. Modern history includes industrialization and globalization.")
-
-        # Select flashcard parameters
-        page.select_option("#quizSubject", "History")
-        page.select_option("#quizDifficulty", "easy")
-
-        # Generate flashcards
-        page.click("text=Generate Flashcards")
-
-        # Wait for response
-        time.sleep(2)
-
-        # Check that flashcard generation was successful
-        print("✓ Flashcard generation from content working correctly")
-
-    def test_ai_tutor_different_subjects(self, browser_context):
+        response = await context.request.post(
+            "http://localhost:5000/api/flashcards/generate",
+            data={
+                "content": "History is the study of past events. Ancient civilizations include Egypt, Greece, and Rome. The Middle Ages followed the fall of Rome. The Renaissance brought cultural revival. Modern history includes industrialization and globalization.",
+                "subject": "History",
+                "difficulty": "easy",
+            },
+        )
+        assert response.ok
+        data = await response.json()
+        assert data.get("success") is True, data
+        assert data.get("flashcards"), data
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "subject,difficulty",
+        [
+            ("Mathematics", "advanced"),
+            ("Language", "beginner"),
+            ("Science", "intermediate"),
+        ],
+    )
+    async def test_ai_tutor_different_subjects(self, home, subject, difficulty):
         """Test AI Tutor with different subjects and difficulty levels"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
-
-        # Test with Mathematics
-        page.select_option("#tutorSubject", "Mathematics")
-        page.select_option("#tutorDifficulty", "advanced")
-        page.click("text=Start Session")
-
-        expect(page.locator("#chatContainer")).to_be_visible()
-        expect(page.locator("text=Mathematics tutor")).to_be_visible()
-
-        # Test with Language
-        page.select_option("#tutorSubject", "Language")
-        page.select_option("#tutorDifficulty", "beginner")
-        page.click("text=Start Session")
-
-        expect(page.locator("text=Language tutor")).to_be_visible()
-
-        print("✓ AI Tutor works with different subjects and difficulty levels")
-
-    def test_mind_map_different_subjects(self, browser_context):
+        page = home
+
+        await page.select_option("#tutorSubject", subject)
+        await page.select_option("#tutorDifficulty", difficulty)
+        await page.click("text=Start Session")
+
+        await expect(page.locator("#chatContainer")).to_be_visible()
+        await expect(page.locator(f"text={subject} tutor")).to_be_visible()
+
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "subject,title,content",
+        [
+            (
+                "Mathematics",
+                "Algebra Basics",
+                "Algebra involves variables, equations, and functions. Linear equations have one variable. Quadratic equations have squared terms. Functions map inputs to outputs.",
+            ),
+            (
+                "History",
+                "World Wars",
+                "World War I lasted from 1914 to 1918. World War II lasted from 1939 to 1945. Both wars involved multiple nations and caused significant global changes.",
+            ),
+        ],
+    )
+    async def test_mind_map_different_subjects(self, home, subject, title, content):
         """Test Mind Map creation with different subjects"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
-
-        # Test Mathematics mind map
-        page.fill("#mindMapTitle", "Algebra Basics")
-        page.select_option("#mindMapSubject", "Mathematics")
-        page.fill("#mindMapContent", "Algebra involves variables, equations, and functions. Linear equations have one variable. Quadratic equations have squared terms. Functions map inputs to outputs.")
-        page.click("text=Generate Mind Map")
-
-        time.sleep(2)
-        expect(page.locator("text=Mathematics")).to_be_visible()
+        page = home
 
-        # Test History mind map
-        page.fill("#mindMapTitle", "World Wars")
-        page.select_option("#mindMapSubject", "History")
-        page.fill("#mindMapContent", "World War I lasted from 1914 to 1918. World War II lasted from 1939 to 1945. Both wars involved multiple nations and caused significant global changes.")
-        page.click("text=Generate Mind Map")
+        await _submit_mind_map(page, title, subject, content)
 
-        time.sleep(2)
-        expect(page.locator("text=History")).to_be_visible()
+        await expect(page.locator(f"text={subject}")).to_be_visible()
 
-        print("✓ Mind Maps work with different subjects")
 
-    def test_statistics_display(self, browser_context):
+    async def test_statistics_display(self, home):
         """Test statistics display and refresh functionality"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = home
 
         # Check that statistics section is visible
-        expect(page.locator("text=Learning Analytics")).to_be_visible()
-        expect(page.locator("#ocrCount")).to_be_visible()
-        expect(page.locator("#quizCount")).to_be_visible()
-        expect(page.locator("#chatCount")).to_be_visible()
-        expect(page.locator("#mindMapCount")).to_be_visible()
-
-        # Click refresh statistics button
-        page.click("text=Refresh Statistics")
+        await expect(page.locator("text=Learning Analytics")).to_be_visible()
+        await expect(page.locator("#ocrCount")).to_be_visible()
+        await expect(page.locator("#quizCount")).to_be_visible()
+        await expect(page.locator("#chatCount")).to_be_visible()
+        await expect(page.locator("#mindMapCount")).to_be_visible()
 
-        # Wait for refresh
-        time.sleep(1)
+        # Click refresh and wait for the stats request instead of sleeping
+        async with page.expect_response(lambda r: "/api/" in r.url):
+            await page.click("text=Refresh Statistics")
 
-        print("✓ Statistics display working correctly")
 
-    def test_responsive_design(self, browser_context):
+    @pytest.mark.slow
+    async def test_responsive_design(self, stub_apis, home):
         """Test responsive design on different screen sizes"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = home
 
         # Test mobile viewport
-        page.set_viewport_size({"width": 375, "height": 667})
+        await page.set_viewport_size({"width": 375, "height": 667})
 
         # Check that elements are still accessible
-        expect(page.locator("text=Phase 5: AI Tutor & Mind Maps")).to_be_visible()
-        expect(page.locator("text=Image Upload & OCR")).to_be_visible()
+        await expect(page.locator("text=Phase 5: AI Tutor & Mind Maps")).to_be_visible()
+        await expect(page.locator("text=Image Upload & OCR")).to_be_visible()
 
         # Test tablet viewport
-        page.set_viewport_size({"width": 768, "height": 1024})
+        await page.set_viewport_size({"width": 768, "height": 1024})
 
         # Check that elements are still accessible
-        expect(page.locator("text=AI Tutor - Your Personal Learning Assistant")).to_be_visible()
+        await expect(page.locator("text=AI Tutor - Your Personal Learning Assistant")).to_be_visible()
 
         # Reset to desktop viewport
-        page.set_viewport_size({"width": 1280, "height": 720})
+        await page.set_viewport_size({"width": 1280, "height": 720})
 
-        print("✓ Responsive design working correctly")
 
-    def test_error_handling(self, browser_context):
+    async def test_error_handling(self, home):
         """Test error handling for invalid inputs"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = home
 
         # Try to create mind map without title
-        page.fill("#mindMapContent", "Some content")
-        page.click("text=Generate Mind Map")
+        await page.fill("#mindMapContent", "Some content")
+        await page.click("text=Generate Mind Map")
 
         # Should show alert for missing title
         # Note: In real testing, we'd check the actual alert content
-        print("✓ Error handling working correctly")
 
-    def test_drag_and_drop_interface(self, browser_context):
+    async def test_drag_and_drop_interface(self, stub_apis, home):
         """Test drag and drop interface elements"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = home
 
         # Check that upload area is present
-        expect(page.locator("text=Drag & Drop Image Here")).to_be_visible()
-        expect(page.locator("text=or click to browse")).to_be_visible()
+        await expect(page.locator("text=Drag & Drop Image Here")).to_be_visible()
+        await expect(page.locator("text=or click to browse")).to_be_visible()
 
         # Check that upload area has proper styling
         upload_area = page.locator("#uploadArea")
-        expect(upload_area).to_have_class("upload-area")
+        await expect(upload_area).to_have_class("upload-area")
 
-        print("✓ Drag and drop interface elements present")
 
-    def test_chat_message_formatting(self, browser_context):
+    async def test_chat_message_formatting(self, home):
         """Test chat message formatting and display"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = home
 
         # Start tutor session
-        page.select_option("#tutorSubject", "General")
-        page.select_option("#tutorDifficulty", "intermediate")
-        page.click("text=Start Session")
+        await page.select_option("#tutorSubject", "General")
+        await page.select_option("#tutorDifficulty", "intermediate")
+        await page.click("text=Start Session")
 
         # Wait for chat container
-        expect(page.locator("#chatContainer")).to_be_visible()
+        await expect(page.locator("#chatContainer")).to_be_visible()
 
         # Check that chat messages container has proper styling
         chat_messages = page.locator("#chatMessages")
-        expect(chat_messages).to_have_class("border rounded p-3")
+        await expect(chat_messages).to_have_class("border rounded p-3")
 
         # Check that chat input is present
-        expect(page.locator("#chatInput")).to_be_visible()
+        await expect(page.locator("#chatInput")).to_be_visible()
 
-        print("✓ Chat message formatting working correctly")
 
-    def test_mind_map_node_interactions(self, browser_context):
+    async def test_mind_map_node_interactions(self, home):
         """Test mind map node interactions and hover effects"""
-        page = browser_context
-
-        # Navigate to the application
-        page.goto("http://localhost:5000")
+        page = home
 
         # Create a mind map
-        page.fill("#mindMapTitle", "Test Map")
-        page.select_option("#mindMapSubject", "General")
-        page.fill("#mindMapContent", "This is a test mind map with multiple concepts. Concept one is about testing. Concept two is about validation. Concept three is about verification.")
-        page.click("text=Generate Mind Map")
-
-        # Wait for generation
-        time.sleep(2)
-
-        # Check that mind map nodes are present
-        nodes = page.locator(".mind-map-node")
-        expect(nodes).to_have_count(greater_than(1))
+        await _submit_mind_map(
+            page,
+            "Test Map",
+            "General",
+            "This is a test mind map with multiple concepts. Concept one is about testing. Concept two is about validation. Concept three is about verification.",
+        )
+
+        # Wait for the nodes to render
+        await page.wait_for_selector(".mind-map-node", timeout=5000)
+
+        # Check that mind map nodes are present beyond the central one
+        await page.wait_for_function(
+            "document.querySelectorAll('.mind-map-node').length >= 2", timeout=3000
+        )
+        assert await page.locator(".mind-map-node").count() >= 2
 
         # Test hover effects (if implemented)
         # Note: This would require more sophisticated testing of CSS hover states
 
-        print("✓ Mind map node interactions working correctly")
-
-def run_phase4_tests():
-    """Run all Phase 4 tests and return results"""
-    print("Running Phase 4: AI Tutor & Mind Maps Tests")
-    print("=" * 60)
-    
-    passed = 0
-    failed = 0
-    
-    # Create test instance
-    test_instance = TestPhase4AITutor()
-    
-    # Run each test method
-    test_methods = [
-        test_instance.test_phase4_homepage_loads,
-        test_instance.test_ai_tutor_session_creation,
-        test_instance.test_ai_tutor_chat_functionality,
-        test_instance.test_mind_map_creation,
-        test_instance.test_mind_map_visualization,
-        test_instance.test_ocr_to_mind_map_workflow,
-        test_instance.test_quiz_generation_from_content,
-        test_instance.test_flashcard_generation_from_content,
-        test_instance.test_ai_tutor_different_subjects,
-        test_instance.test_mind_map_different_subjects,
-        test_instance.test_statistics_display,
-        test_instance.test_responsive_design,
-        test_instance.test_error_handling,
-        test_instance.test_drag_and_drop_interface,
-        test_instance.test_chat_message_formatting,
-        test_instance.test_mind_map_node_interactions
-    ]
-    
-    for test_method in test_methods:
-        try:
-            # Create a mock browser context for testing
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context()
-                page = context.new_page()
-                
-                # Run the test
-                test_method(page)
-                passed += 1
-                print(f"PASSED: {test_method.__name__}")
-                
-                context.close()
-                browser.close()
-                
-        except Exception as e:
-            failed += 1
-            print(f"FAILED: {test_method.__name__}: {str(e)}")
-    
-    print("\n" + "=" * 60)
-    print(f"PHASE 4 TEST RESULTS: {passed} passed, {failed} failed")
-    print("=" * 60)
-    
-    return passed, failed
 
 if __name__ == "__main__":
-    run_phase4_tests()
+    import sys
+    sys.exit(pytest.main([__file__, "-n", "auto", "-q"]))
@@ -1,134 +1,117 @@
 """
 Phase 6: Comprehensive Testing & Deployment Preparation
 Tests all features: OCR, AI generation, quiz system, AI tutor, mind maps, gamification, PWA, multilingual
+
+Runs under pytest on the session-scoped phase6_browser from conftest.py,
+shared with test_phase6_comprehensive_testing.py so a full-suite run
+launches Chromium once.
 """
 
 import asyncio
-from playwright.async_api import async_playwright
-import time
 
-async def test_phase6_comprehensive():
+from _phase6_common import BASE_URL, ROUTES
+
+async def assert_marker(request_context, url, marker, label):
+    """GET one route and report whether the marker text is in the HTML."""
+    response = await request_context.get(f"{BASE_URL}{url}")
+    ok = response.ok and marker in await response.text()
+    if ok:
+        print(f"✅ {label} loaded successfully")
+    else:
+        print(f"❌ {label} failed to load")
+    return ok
+
+async def test_phase6_comprehensive(phase6_context):
     """Run comprehensive Phase 6 tests"""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        page = await browser.new_page()
-        
-        try:
-            print("🚀 Phase 6: Comprehensive Testing & Deployment Preparation")
-            print("=" * 70)
-            
-            # Test 1: OCR Accuracy (Target: ≥80%)
-            print("\n🔍 Test 1: OCR Accuracy Testing")
-            await page.goto("http://localhost:5000/ocr")
-            await page.wait_for_load_state("networkidle")
-            
-            ocr_title = await page.locator("text=OCR Image Processing").first
-            if await ocr_title.is_visible():
-                print("✅ OCR page loaded successfully")
-            else:
-                print("❌ OCR page failed to load")
-            
-            # Test 2: AI Content Generation
-            print("\n🤖 Test 2: AI Content Generation")
-            await page.goto("http://localhost:5000/ai_generate")
-            await page.wait_for_load_state("networkidle")
-            
-            ai_title = await page.locator("text=AI Content Generation").first
-            if await ai_title.is_visible():
-                print("✅ AI generation page loaded successfully")
-            else:
-                print("❌ AI generation page failed to load")
-            
-            # Test 3: Quiz System
-            print("\n❓ Test 3: Quiz System")
-            await page.goto("http://localhost:5000/quiz")
-            await page.wait_for_load_state("networkidle")
-            
-            quiz_title = await page.locator("text=Quiz Generator").first
-            if await quiz_title.is_visible():
-                print("✅ Quiz page loaded successfully")
-            else:
-                print("❌ Quiz page failed to load")
-            
-            # Test 4: AI Tutor
-            print("\n👨‍🏫 Test 4: AI Tutor")
-            await page.goto("http://localhost:5000/ai_tutor")
-            await page.wait_for_load_state("networkidle")
-            
-            tutor_title = await page.locator("text=AI Tutor").first
-            if await tutor_title.is_visible():
-                print("✅ AI Tutor page loaded successfully")
-            else:
-                print("❌ AI Tutor page failed to load")
-            
-            # Test 5: Mind Maps
-            print("\n🧠 Test 5: Mind Maps")
-            await page.goto("http://localhost:5000/mind_map")
-            await page.wait_for_load_state("networkidle")
-            
-            mindmap_title = await page.locator("text=Mind Map Generator").first
-            if await mindmap_title.is_visible():
-                print("✅ Mind Map page loaded successfully")
-            else:
-                print("❌ Mind Map page failed to load")
-            
-            # Test 6: Gamification
-            print("\n🎮 Test 6: Gamification System")
-            await page.goto("http://localhost:5000/")
-            await page.wait_for_load_state("networkidle")
-            
-            gamification_section = await page.locator("text=Gamification Dashboard").first
-            if await gamification_section.is_visible():
-                print("✅ Gamification dashboard found")
-            else:
-                print("❌ Gamification dashboard not found")
-            
-            # Test 7: PWA Features
-            print("\n📱 Test 7: PWA & Offline Features")
-            offline_section = await page.locator("text=Offline Support").first
-            if await offline_section.is_visible():
-                print("✅ Offline support section found")
-            else:
-                print("❌ Offline support section not found")
-            
-            # Test 8: Multilingual Support
-            print("\n🌍 Test 8: Multilingual Support")
-            multilingual_section = await page.locator("text=Multilingual Support").first
-            if await multilingual_section.is_visible():
-                print("✅ Multilingual support found")
-            else:
-                print("❌ Multilingual support not found")
-            
-            # Test 9: Performance
-            print("\n⚡ Test 9: Performance Testing")
-            start_time = time.time()
-            await page.goto("http://localhost:5000/")
-            await page.wait_for_load_state("networkidle")
-            load_time = time.time() - start_time
-            
-            if load_time < 5.0:
-                print(f"✅ Page load time: {load_time:.2f}s (Target: <5s)")
-            else:
-                print(f"⚠️ Page load time: {load_time:.2f}s (Target: <5s)")
-            
-            # Test 10: API Endpoints
-            print("\n🔌 Test 10: API Endpoints")
-            response = await page.request.get("http://localhost:5000/api/gamification/progress")
-            if response.status == 200:
-                print("✅ Gamification API working")
-            else:
-                print("❌ Gamification API failed")
-            
-            print("\n🎉 Phase 6 Comprehensive Testing Completed!")
-            print("📊 All features tested and ready for deployment!")
-            
-        except Exception as e:
-            print(f"❌ Test failed: {e}")
-        finally:
-            await browser.close()
+    context = phase6_context
 
-if __name__ == "__main__":
-    asyncio.run(test_phase6_comprehensive())
+    print("🚀 Phase 6: Comprehensive Testing & Deployment Preparation")
+    print("=" * 70)
+
+    # Tests 1-8: feature markup, probed concurrently over HTTP — no DOM
+    # is needed to find a static heading
+    print("\n🔍 Tests 1-8: Feature Page Checks")
+    results = await asyncio.gather(
+        *[
+            assert_marker(context.request, url, marker, label)
+            for url, marker, label in ROUTES
+        ]
+    )
+    assert all(results), [
+        label for (_, _, label), ok in zip(ROUTES, results) if not ok
+    ]
+
+    # Test 9: Performance — a real page load, since this is the one
+    # check that measures rendered navigation. The browser's own
+    # navigation timing is read instead of wall-clocking goto, which
+    # would fold Playwright protocol overhead into the number.
+    print("\n⚡ Test 9: Performance Testing")
+    # Warm the server first so the timed navigation measures steady-state
+    # rendering, not Flask's lazy first-request work (template
+    # compilation, DB connections, module init)
+    await asyncio.gather(
+        context.request.get(f"{BASE_URL}/"),
+        context.request.get(f"{BASE_URL}/api/gamification/progress"),
+    )
+    page = await context.new_page()
+    await page.goto(f"{BASE_URL}/", wait_until="domcontentloaded")
+    await page.locator("text=Gamification Dashboard").first.wait_for(
+        state="visible", timeout=5000
+    )
+    await page.wait_for_load_state("load")
+    metrics = await page.evaluate(
+        """() => {
+            const t = performance.getEntriesByType('navigation')[0];
+            return {
+                ttfb: t.responseStart - t.requestStart,
+                dcl: t.domContentLoadedEventEnd - t.startTime,
+                load: t.loadEventEnd - t.startTime,
+            };
+        }"""
+    )
+    print(
+        f"   TTFB: {metrics['ttfb']:.0f}ms, DCL: {metrics['dcl']:.0f}ms, "
+        f"load: {metrics['load']:.0f}ms"
+    )
+    assert metrics["load"] < 5000, f"Page load time {metrics['load']:.0f}ms (Target: <5s)"
+    print(f"✅ Page load time: {metrics['load']:.0f}ms (Target: <5s)")
 
+    # Test 10: API Endpoints — independent probes, issued concurrently
+    print("\n🔌 Test 10: API Endpoints")
+    api_urls = [
+        "/api/health",
+        "/api/gamification/progress",
+        "/api/offline/stats",
+        "/api/multilingual/languages",
+    ]
+    responses = await asyncio.gather(
+        *[context.request.get(f"{BASE_URL}{url}") for url in api_urls]
+    )
+    failed = [url for url, r in zip(api_urls, responses) if r.status != 200]
+    assert not failed, f"API endpoints failed: {failed}"
+    print("✅ API endpoints working")
+    await page.close()
+
+    print("\n🎉 Phase 6 Comprehensive Testing Completed!")
+    print("📊 All features tested and ready for deployment!")
+
+async def test_pwa_service_worker(phase6_pwa_context):
+    """Service worker support is reachable on the SW-enabled context
+
+    The default phase 6 context blocks service workers so ordinary
+    navigations stay deterministic; this one check runs on the
+    unblocked context to keep the PWA path covered.
+    """
+    page = await phase6_pwa_context.new_page()
+    try:
+        await page.goto(f"{BASE_URL}/", wait_until="domcontentloaded")
+        assert await page.evaluate("'serviceWorker' in navigator")
+    finally:
+        await page.close()
+
+if __name__ == "__main__":
+    import sys
 
+    import pytest
 
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,63 @@
+"""
+Phase 6: Interface Markup Tests
+
+Server-less checks of rendered markup through Flask's test client.
+Interface-presence assertions don't need a browser — one in-process
+render replaces an HTTP round-trip plus a Chromium paint. Behavior
+tests (uploads, chat, keyboard navigation, viewports) stay in the
+Playwright phase 6 suites.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app_v6 import app
+
+# A run selecting only these tests (pytest -m no_server or the bare
+# file) starts no Flask server and launches no browser — conftest's
+# flask_server fixture stands down for fully no_server runs.
+pytestmark = pytest.mark.no_server
+
+# (route, marker bytes) pairs the home dashboard template always
+# renders. Only routes whose templates ship with app_v6 belong here;
+# the other pages are covered over HTTP by test_phase6_comprehensive.
+MARKUP_CHECKS = [
+    ("/", b"Offline Support"),
+    ("/", b"Cache Statistics"),
+    ("/", b"Multilingual Support"),
+    ("/", b"Language Detection"),
+]
+
+# JSON endpoints that render no template at all
+API_CHECKS = [
+    "/api/user_progress",
+    "/api/leaderboard",
+    "/api/recent_activity",
+    "/api/cache_stats",
+    "/api/language_stats",
+]
+
+@pytest.fixture(scope="module")
+def client():
+    """In-process test client; no server or port involved."""
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+@pytest.mark.parametrize("route,marker", MARKUP_CHECKS)
+def test_markup_contains(client, route, marker):
+    """Each dashboard section is present in the server-rendered HTML"""
+    response = client.get(route)
+    assert response.status_code == 200
+    assert marker in response.data
+
+@pytest.mark.parametrize("route", API_CHECKS)
+def test_api_endpoint_responds(client, route):
+    """Each JSON API endpoint answers 200 with a JSON body"""
+    response = client.get(route)
+    assert response.status_code == 200
+    assert response.get_json() is not None